@@ -1,4 +1,5 @@
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
 import sqlite3
 from datetime import datetime
@@ -8,13 +9,33 @@ import webbrowser
 from typing import List, Optional, Tuple
 import logging
 from dataclasses import dataclass
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlparse
 import time
 import random
+import asyncio
+import functools
+import threading
+import concurrent.futures
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 import re  # Add this import at the top
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # Fall back to threaded requests if aiohttp is missing
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None  # Repeat searches just re-fetch without it
+
+try:
+    import lxml  # noqa: F401
+    _BS_PARSER = 'lxml'  # C parser, several times faster on big pages
+except ImportError:
+    _BS_PARSER = 'html.parser'
+
 # Add debug logging configuration
 logging.basicConfig(
     level=logging.DEBUG,
@@ -22,6 +43,96 @@ logging.basicConfig(
     filename='price_comparison.log'
 )
 
+# Patterns and translation tables compiled once at import, since the
+# parsing helpers below run for every scraped item (up to ~90 per search).
+_NONNUM_RE = re.compile(r'[^\d.,]')
+_MODEL_RE = re.compile(r'([a-z0-9]+-?[a-z0-9]+)')
+_SPEC_RE = re.compile(r'\d+[gt]b|rtx\s*\d+|i\d-\d+|\d+th|ddr\d')
+_AMAZON_ID_RES = [
+    re.compile(r'/dp/([A-Z0-9]{10})'),
+    re.compile(r'product/([A-Z0-9]{10})'),
+]
+_NONWORD_RE = re.compile(r'[^\w\s-]')
+_ARABIC_TRANS = str.maketrans('٠١٢٣٤٥٦٧٨٩', '0123456789')
+# Deletion table for bytes.translate: every byte except digits, '.' and
+# ',' — lets ASCII price strings be scrubbed in a single C call.
+_DROP_BYTES = bytes(b for b in range(256) if not (48 <= b <= 57 or b in (46, 44)))
+
+# CSS selectors compiled once per process instead of re-parsed on every
+# select call. The item selectors stay merged comma lists because every
+# match is consumed; the per-field fallbacks are kept as ordered tuples
+# tried one by one — a comma list returns the first match in document
+# order, which lets a last-resort ancestor (e.g. Amazon's .a-price)
+# shadow the preferred .a-offscreen child and corrupt the price text.
+_AMZ_ITEMS = soupsieve.compile('div.s-result-item:not(.AdHolder)')
+_AMZ_NAMES = (
+    soupsieve.compile('h2 span.a-text-normal'),
+    soupsieve.compile('.a-size-medium.a-text-normal'),
+    soupsieve.compile('.a-size-base-plus'),
+)
+_AMZ_PRICES = (
+    soupsieve.compile('span.a-price span.a-offscreen'),
+    soupsieve.compile('span.a-price .a-price-whole'),
+    soupsieve.compile('.a-price'),
+)
+_AMZ_LINK = soupsieve.compile('a.a-link-normal[href*="/dp/"]')
+
+_NOON_ITEMS = soupsieve.compile(
+    'div[data-qa="product-grid"] div[data-qa="product-item"], div.productContainer'
+)
+_NOON_NAMES = (
+    soupsieve.compile('div[data-qa="product-name"]'),
+    soupsieve.compile('div.name'),
+)
+_NOON_PRICES = (
+    soupsieve.compile('div[data-qa="price-box"] strong'),
+    soupsieve.compile('span.price'),
+)
+_NOON_LINK = soupsieve.compile('a[href*="/egypt-en/"]')
+
+_CRF_ITEMS = soupsieve.compile('div.product-item, div.product_grid_item')
+_CRF_NAMES = (
+    soupsieve.compile('.product-name'),
+    soupsieve.compile('.name'),
+)
+_CRF_PRICES = (
+    soupsieve.compile('.price'),
+    soupsieve.compile('.product-price'),
+)
+_CRF_LINK = soupsieve.compile('a[href*="/p/"]')
+
+def _select_first(selectors, item):
+    """Return the first match, trying selectors in priority order."""
+    for selector in selectors:
+        if (elem := selector.select_one(item)) is not None:
+            return elem
+    return None
+
+@functools.lru_cache(maxsize=2048)
+def _clean_text_for_comparison(text: str) -> str:
+    """Clean text for comparison by removing special characters and extra spaces."""
+    # Single C-level scan instead of a Python loop per character
+    cleaned = _NONWORD_RE.sub('', text)
+    return ' '.join(cleaned.lower().split())
+
+@functools.lru_cache(maxsize=2048)
+def _normalize_text(text: str) -> str:
+    """Normalize text for comparison."""
+    return ' '.join(text.lower().split())
+
+@functools.lru_cache(maxsize=2048)
+def _simplified_text(text: str) -> str:
+    """Convert text to simple searchable format."""
+    # Remove special chars and extra spaces
+    cleaned = _NONWORD_RE.sub(' ', text.lower())
+    return ' '.join(cleaned.split())
+
+@functools.lru_cache(maxsize=2048)
+def _extract_specs(text: str) -> Tuple[str, ...]:
+    """Extract specifications from text."""
+    # Tuple so the cached value stays hashable and immutable
+    return tuple(word for word in text.lower().split() if _SPEC_RE.search(word))
+
 def clear_terminal() -> None:
     """Clear terminal screen safely across different platforms."""
     try:
@@ -31,36 +142,31 @@ def clear_terminal() -> None:
     except Exception:
         print('\n' * 100)
 
-def loading_animation() -> None:
-    """Simple single line loading animation."""
+def loading_animation(stop_event: threading.Event) -> None:
+    """Animate the search spinner until stop_event is set.
+
+    Runs in a daemon thread alongside the scrape, so the animation
+    lasts exactly as long as the work instead of adding fixed delay.
+    """
     animation = "⣾⣽⣻⢿⡿⣟⣯⣷"
     message = "🔍 Searching Egyptian stores for best prices..."
+    frame_idx = 0
     try:
         sys.stdout.write("\033[?25l")
-        for frame in animation * 3:
+        while not stop_event.is_set():
+            frame = animation[frame_idx % len(animation)]
             sys.stdout.write(f"\r{frame} {message}")
             sys.stdout.flush()
             time.sleep(0.1)
+            frame_idx += 1
         print()
     finally:
         sys.stdout.write("\033[?25h")
         sys.stdout.flush()
 
-def loading_animation_inline() -> None:
-    """Display inline loading animation."""
-    animation = "⣾⣽⣻⢿⡿⣟⣯⣷"
-    try:
-        sys.stdout.write("\033[?25l")
-        for frame in animation * 2:
-            sys.stdout.write(f"\r{frame} Processing...")
-            sys.stdout.flush()
-            time.sleep(0.1)
-    finally:
-        sys.stdout.write("\r" + " " * 20 + "\r")  # Clear animation
-        sys.stdout.write("\033[?25h")
-        sys.stdout.flush()
-
-@dataclass
+# slots drops the per-instance __dict__ (dozens of instances per search)
+# and frozen makes products hashable for set-based dedup
+@dataclass(slots=True, frozen=True)
 class Product:
     name: str
     price: float
@@ -68,108 +174,166 @@ class Product:
     url: str
     timestamp: datetime
 
+@dataclass
+class SearchTerms:
+    """Preprocessed search query shared by the relevance checks.
+
+    Lowercasing and splitting happen once here instead of once per
+    scraped product in _check_relevance.
+    """
+    variations: List[str]
+    lowered: frozenset
+    joined_lower: str
+
 class DatabaseManager:
     def __init__(self, db_name: str = 'product_prices.db'):
         self.db_name = db_name
         # Add datetime adapter for SQLite
         sqlite3.register_adapter(datetime, lambda x: x.isoformat())
+        # One long-lived connection instead of a fresh connect per call.
+        # WAL + synchronous=NORMAL avoids an fsync of the rollback journal
+        # on every commit; check_same_thread=False because scrapers may
+        # hand results over from worker threads.
+        self.conn = sqlite3.connect(
+            self.db_name, check_same_thread=False, isolation_level=None
+        )
+        self.conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+        ''')
         self.setup_database()
 
+    def close(self) -> None:
+        """Close the database connection."""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def setup_database(self) -> None:
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS products (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT,
-                    price REAL,
-                    website TEXT,
-                    url TEXT,
-                    timestamp DATETIME,
-                    UNIQUE(name, website)
-                )
-            ''')
-            conn.commit()
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS products (
+                id INTEGER PRIMARY KEY,
+                name TEXT,
+                price REAL,
+                website TEXT,
+                url TEXT,
+                timestamp DATETIME,
+                UNIQUE(name, website)
+            )
+        ''')
+        # Cover the read paths: save_best_deal's per-name cheapest lookup
+        # and get_products_summary's GROUP BY name / ORDER BY timestamp.
+        self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_products_name_price
+            ON products(name, price)
+        ''')
+        self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_products_name_timestamp
+            ON products(name, timestamp DESC)
+        ''')
 
     def save_product(self, product: Product) -> None:
         if not product.name or product.price is None:
             return
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO products 
+        self.conn.execute('''
+            INSERT OR REPLACE INTO products
+            (name, price, website, url, timestamp)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (
+            product.name, product.price, product.website, product.url, product.timestamp
+        ))
+
+    def save_products(self, products: List[Product]) -> None:
+        """Save a batch of products in a single transaction."""
+        rows = [
+            (p.name, p.price, p.website, p.url, p.timestamp)
+            for p in products
+            if p.name and p.price is not None
+        ]
+        if not rows:
+            return
+        self.conn.execute('BEGIN')
+        try:
+            self.conn.executemany('''
+                INSERT OR REPLACE INTO products
                 (name, price, website, url, timestamp)
                 VALUES (?, ?, ?, ?, ?)
-            ''', (
-                product.name, product.price, product.website, product.url, product.timestamp
-            ))
-            conn.commit()
+            ''', rows)
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        # Refresh planner statistics after a bulk insert so the indexes
+        # above actually get picked.
+        self.conn.execute('ANALYZE')
 
     def save_best_deal(self, product: Product) -> None:
         """Save only the best deal found for a product."""
         if not product.name or product.price is None:
             return
-        
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            
-            # Check if we already have a better price for this product
-            cursor.execute('''
-                SELECT price FROM products 
-                WHERE name = ? 
-                ORDER BY price ASC 
-                LIMIT 1
-            ''', (product.name,))
-            
-            result = cursor.fetchone()
-            if not result or product.price < result[0]:
-                # Save new best price
-                cursor.execute('''
-                    INSERT OR REPLACE INTO products 
-                    (name, price, website, url, timestamp)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
-                    product.name, product.price, product.website, 
-                    product.url, product.timestamp
-                ))
-                conn.commit()
+
+        # Single UPSERT: insert the row, or update it only when the new
+        # price beats the stored one. Avoids the SELECT-then-INSERT round
+        # trip and the race between them. Requires SQLite >= 3.24.
+        self.conn.execute('''
+            INSERT INTO products (name, price, website, url, timestamp)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(name, website) DO UPDATE SET
+                price = excluded.price,
+                url = excluded.url,
+                timestamp = excluded.timestamp
+            WHERE excluded.price < products.price
+        ''', (
+            product.name, product.price, product.website,
+            product.url, product.timestamp
+        ))
 
     def get_products_summary(self) -> List[Tuple[str, float, float]]:
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT name, MIN(price), AVG(price) 
-                FROM products 
-                GROUP BY name
-                ORDER BY MIN(timestamp) DESC
-            ''')
-            return cursor.fetchall()
+        cursor = self.conn.execute('''
+            SELECT name, MIN(price), AVG(price)
+            FROM products
+            GROUP BY name
+            ORDER BY MIN(timestamp) DESC
+        ''')
+        return cursor.fetchall()
 
     def clear_database(self) -> None:
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM products')
-            conn.commit()
+        self.conn.execute('DELETE FROM products')
 
 class WebScraper:
+    # frozenset for O(1) membership checks in _prepare_search_query
+    common_brands = frozenset({
+        'lenovo', 'hp', 'dell', 'asus', 'acer', 'msi', 'apple',
+        'samsung', 'xiaomi', 'huawei', 'oppo', 'realme', 'honor',
+        'sony', 'lg', 'toshiba', 'anker', 'joyroom',
+    })
+
+    # Minimum spacing between two requests to the same host, seconds
+    _MIN_HOST_INTERVAL = 1.0
+
     def __init__(self):
         self.session = self._create_session()
+        self._last_hit: dict = {}
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
         }
 
-    def _clean_text_for_comparison(self, text: str) -> str:
-        """Clean text for comparison by removing special characters and extra spaces."""
-        # Keep only alphanumeric, spaces, and dashes
-        cleaned = ''.join(c for c in text if c.isalnum() or c.isspace() or c == '-')
-        return ' '.join(cleaned.lower().split())
-
     def _exact_text_match(self, text1: str, text2: str) -> bool:
         """Check if two product names match."""
-        t1 = self._clean_text_for_comparison(text1)
-        t2 = self._clean_text_for_comparison(text2)
+        t1 = _clean_text_for_comparison(text1)
+        t2 = _clean_text_for_comparison(text2)
         
         # Try exact match first
         if t1 == t2:
@@ -180,26 +344,63 @@ class WebScraper:
             return True
             
         # Try matching the model number
-        model_pattern = r'([a-z0-9]+-?[a-z0-9]+)'
-        t1_models = set(re.findall(model_pattern, t1))
-        t2_models = set(re.findall(model_pattern, t2))
+        t1_models = set(_MODEL_RE.findall(t1))
+        t2_models = set(_MODEL_RE.findall(t2))
         
         return bool(t1_models & t2_models)
 
     def _create_session(self):
-        session = requests.Session()
+        if requests_cache is not None:
+            # Serve repeat searches from a 10-minute on-disk cache so
+            # re-running the same query skips the network entirely.
+            session = requests_cache.CachedSession(
+                'http_cache',
+                backend='sqlite',
+                expire_after=600,
+                allowable_methods=['GET'],
+            )
+        else:
+            session = requests.Session()
         retry = Retry(total=5, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
-        adapter = HTTPAdapter(max_retries=retry)
+        # Larger pools so concurrent scrapes and retries reuse connections
+        # instead of discarding them and paying a new TLS handshake.
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=32, pool_maxsize=32)
         session.mount('http://', adapter)
         session.mount('https://', adapter)
         return session
 
+    def _host_delay(self, url: str) -> float:
+        """Seconds to wait before hitting this URL's host again.
+
+        Unlike the old unconditional 1-2s sleep, this only pauses when
+        the same host was hit within the last second, so the first
+        request per store — the normal case — proceeds immediately.
+        """
+        host = urlparse(url).netloc
+        now = time.monotonic()
+        delta = now - self._last_hit.get(host, 0.0)
+        self._last_hit[host] = now
+        if delta < self._MIN_HOST_INTERVAL:
+            return self._MIN_HOST_INTERVAL - delta + random.uniform(0, 0.3)
+        return 0.0
+
     def get_soup(self, url: str) -> Optional[BeautifulSoup]:
         try:
-            time.sleep(random.uniform(1, 2))
-            response = self.session.get(url, headers=self.headers, timeout=10)
+            if (delay := self._host_delay(url)) > 0:
+                time.sleep(delay)
+            response = self.session.get(
+                url, headers=self.headers, timeout=10, stream=True
+            )
             response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
+            try:
+                # Feed the socket stream straight into the parser instead
+                # of buffering the whole body; urllib3 gunzips as we read.
+                response.raw.decode_content = True
+                return BeautifulSoup(
+                    response.raw, _BS_PARSER, from_encoding=response.encoding
+                )
+            finally:
+                response.close()
         except Exception as e:
             logging.error(f"Error fetching {url}: {str(e)}")
             return None
@@ -207,52 +408,63 @@ class WebScraper:
     def _extract_price(self, price_text: str) -> Optional[float]:
         """Enhanced price extraction."""
         try:
-            # Remove all non-numeric characters except . and ,
-            price_text = re.sub(r'[^\d,.]', '', price_text)
-            
-            # Handle Arabic numerals
-            arabic_to_english = str.maketrans('٠١٢٣٤٥٦٧٨٩', '0123456789')
-            price_text = price_text.translate(arabic_to_english)
-            
+            # Fast path: ASCII input (the common case for Amazon/Noon
+            # prices, currency text included) is scrubbed with a single
+            # bytes.translate deletion pass instead of the regex.
+            if price_text.isascii():
+                cleaned = (
+                    price_text.encode('ascii')
+                    .translate(None, _DROP_BYTES)
+                    .decode('ascii')
+                )
+            else:
+                # Handle Arabic numerals, then drop currency symbols/text
+                cleaned = _NONNUM_RE.sub('', price_text.translate(_ARABIC_TRANS))
+
             # Handle different price formats
-            if ',' in price_text and '.' in price_text:
-                price_text = price_text.replace(',', '')
-            elif ',' in price_text:
-                price_text = price_text.replace(',', '.')
-                
+            if ',' in cleaned and '.' in cleaned:
+                cleaned = cleaned.replace(',', '')
+            elif ',' in cleaned:
+                cleaned = cleaned.replace(',', '.')
+
             # Convert to float
-            return float(price_text)
+            return float(cleaned)
         except (ValueError, AttributeError):
             return None
 
-    def _prepare_search_query(self, query: str) -> List[str]:
+    def _prepare_search_query(self, query: str) -> SearchTerms:
         """Prepare multiple search variations."""
         query = query.strip().lower()
-        
+        words = query.split()
+
         # Extract model number if present
-        model_pattern = r'([a-z0-9]+-?[a-z0-9]+)'
-        model_numbers = re.findall(model_pattern, query)
-        
+        model_numbers = _MODEL_RE.findall(query)
+
         # Find brand name
-        brand = next((word for word in query.split() if word in self.common_brands), '')
-        
+        brand = next((word for word in words if word in self.common_brands), '')
+
         # Create search variations
         variations = []
         if brand and model_numbers:
             variations.append(f"{brand} {model_numbers[0]}")
-        
+
         # Add first 3 words
-        words = query.split()[:3]
-        variations.append(' '.join(words))
-        
+        variations.append(' '.join(words[:3]))
+
         # Add full query
         variations.append(query)
-        
+
         # Add model number only if exists
         if model_numbers:
             variations.append(model_numbers[0])
-            
-        return list(set(variations))  # Remove duplicates
+
+        return SearchTerms(
+            # dict.fromkeys dedups while keeping insertion order, so the
+            # variation ordering stays deterministic run to run
+            variations=list(dict.fromkeys(variations)),
+            lowered=frozenset(words),
+            joined_lower=query,
+        )
 
     def _check_availability(self, item_soup: BeautifulSoup, website: str) -> bool:
         """Check if product is actually available for purchase."""
@@ -267,37 +479,33 @@ class WebScraper:
             return not bool(item_soup.select_one('.-mas'))
         return True
 
-    def _check_relevance(self, product_name: str, search_terms: List[str]) -> bool:
+    def _check_relevance(self, product_name: str, search_terms: SearchTerms) -> bool:
         """Improved relevance checking."""
-        if not product_name or not search_terms:
+        if not product_name or not search_terms.lowered:
             return False
-            
-        product_name = product_name.lower()
-        
+
+        name_lower = product_name.lower()
+
         # Important keywords that must be present
-        critical_terms = ['lenovo', 'legion', 'laptop'] if 'lenovo legion' in ' '.join(search_terms).lower() else []
-        if critical_terms and not all(term in product_name for term in critical_terms):
-            return False
-            
-        # Check individual word matches
-        matches = sum(1 for term in search_terms if term.lower() in product_name)
-        return matches / len(search_terms) >= 0.4  # Reduced threshold for better matches
+        if 'lenovo legion' in search_terms.joined_lower:
+            if not all(term in name_lower for term in ('lenovo', 'legion', 'laptop')):
+                return False
 
-    def _normalize_text(self, text: str) -> str:
-        """Normalize text for comparison."""
-        return ' '.join(text.lower().split())
+        # Check individual word matches
+        matches = sum(1 for term in search_terms.lowered if term in name_lower)
+        return matches / len(search_terms.lowered) >= 0.4  # Reduced threshold for better matches
 
     def _exact_match_score(self, product_name: str, search_query: str) -> float:
         """Calculate how closely the product name matches search query."""
         if not product_name or not search_query:
             return 0.0
             
-        product = self._normalize_text(product_name)
-        query = self._normalize_text(search_query)
-        
+        product = _normalize_text(product_name)
+        query = _normalize_text(search_query)
+
         # Extract key specifications
-        query_specs = self._extract_specs(query)
-        product_specs = self._extract_specs(product)
+        query_specs = _extract_specs(query)
+        product_specs = _extract_specs(product)
         
         # Calculate matches
         spec_matches = sum(1 for spec in query_specs if spec in product_specs)
@@ -305,77 +513,68 @@ class WebScraper:
         
         return spec_matches / total_specs
 
-    def _extract_specs(self, text: str) -> List[str]:
-        """Extract specifications from text."""
-        specs = []
-        words = text.lower().split()
-        
-        # Patterns to match
-        patterns = [
-            r'\d+gb',
-            r'\d+tb',
-            r'rtx\s*\d+',
-            r'i\d-\d+',
-            r'\d+th',
-            r'ddr\d',
-        ]
-        
-        for word in words:
-            for pattern in patterns:
-                if re.search(pattern, word):
-                    specs.append(word)
-                    
-        return specs
-
     def _extract_amazon_product_id(self, url: str) -> Optional[str]:
         """Extract Amazon product ID from URL."""
-        patterns = [
-            r'/dp/([A-Z0-9]{10})',
-            r'product/([A-Z0-9]{10})',
-        ]
-        for pattern in patterns:
-            if match := re.search(pattern, url):
+        for pattern in _AMAZON_ID_RES:
+            if match := pattern.search(url):
                 return match.group(1)
         return None
 
-    def _simplified_text(self, text: str) -> str:
-        """Convert text to simple searchable format."""
-        # Remove special chars and extra spaces
-        cleaned = re.sub(r'[^\w\s-]', ' ', text.lower())
-        return ' '.join(cleaned.split())
+    async def _fetch(self, session, url: str) -> Optional[BeautifulSoup]:
+        """Fetch a page asynchronously and return parsed soup."""
+        try:
+            if (delay := self._host_delay(url)) > 0:
+                await asyncio.sleep(delay)
+            async with session.get(url) as response:
+                response.raise_for_status()
+                body = await response.read()
+                encoding = response.charset
+            return BeautifulSoup(body, _BS_PARSER, from_encoding=encoding)
+        except Exception as e:
+            logging.error(f"Error fetching {url}: {str(e)}")
+            return None
+
+    def _amazon_url(self, query: str) -> str:
+        return f"https://www.amazon.eg/s?k={quote_plus(query)}&language=en"
+
+    def _noon_url(self, query: str) -> str:
+        return f"https://www.noon.com/egypt-en/search?q={quote_plus(query)}"
+
+    def _carrefour_url(self, query: str) -> str:
+        return f"https://www.carrefouregypt.com/mafegy/en/search?q={quote_plus(query)}"
 
     def scrape_amazon(self, query: str) -> List[Product]:
         """Direct Amazon search with better product matching."""
-        products = []
-        
-        # Fix URL undefined error and add search URL
-        search_url = f"https://www.amazon.eg/s?k={quote_plus(query)}&language=en"
         print("\r🔍 Checking Amazon.eg...")
-        
-        soup = self.get_soup(search_url)
+        soup = self.get_soup(self._amazon_url(query))
+        return self._parse_amazon(soup)
+
+    async def scrape_amazon_async(self, session, query: str) -> List[Product]:
+        """Async variant of scrape_amazon sharing the same parser."""
+        print("\r🔍 Checking Amazon.eg...")
+        soup = await self._fetch(session, self._amazon_url(query))
+        return self._parse_amazon(soup)
+
+    def _parse_amazon(self, soup: Optional[BeautifulSoup]) -> List[Product]:
+        products = []
+        # Buffer per-item progress lines and write once per site instead
+        # of one flushed stdout write per product. Local so concurrently
+        # running parsers don't interleave.
+        lines = []
         if not soup:
             return products
 
         # Update selectors to match Amazon's current structure
-        items = soup.select('div.s-result-item:not(.AdHolder)')
+        # limit=30 stops the tree walk at the 30th result instead of
+        # collecting every item on the page and slicing afterwards
+        items = _AMZ_ITEMS.select(soup, limit=30)
         print(f"Found {len(items)} items on Amazon...")
 
-        for item in items[:30]:
+        for item in items:
             try:
-                # Try multiple selectors for product info
-                name_elem = (
-                    item.select_one('h2 span.a-text-normal') or 
-                    item.select_one('.a-size-medium.a-text-normal') or
-                    item.select_one('.a-size-base-plus')
-                )
-                
-                price_elem = (
-                    item.select_one('span.a-price span.a-offscreen') or
-                    item.select_one('span.a-price .a-price-whole') or
-                    item.select_one('.a-price')
-                )
-                
-                link = item.select_one('a.a-link-normal[href*="/dp/"]')
+                name_elem = _select_first(_AMZ_NAMES, item)
+                price_elem = _select_first(_AMZ_PRICES, item)
+                link = _AMZ_LINK.select_one(item)
                 
                 if not all([name_elem, price_elem, link]):
                     continue
@@ -397,48 +596,42 @@ class WebScraper:
                     url=product_url,
                     timestamp=datetime.now()
                 ))
-                print(f"Found on Amazon: {name[:70]}... ({price} EGP)")
+                lines.append(f"Found on Amazon: {name[:70]}... ({price} EGP)")
 
             except Exception as e:
                 logging.debug(f"Error parsing Amazon item: {str(e)}")
                 continue
 
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
         return products
 
-    def _extract_price(self, price_text: str) -> Optional[float]:
-        """Enhanced price extraction for Amazon."""
-        try:
-            # Remove currency symbols and text
-            price_text = re.sub(r'[^\d.,]', '', price_text)
-            
-            # Handle different number formats
-            if ',' in price_text and '.' in price_text:
-                price_text = price_text.replace(',', '')
-            elif ',' in price_text:
-                price_text = price_text.replace(',', '.')
-            
-            return float(price_text)
-        except (ValueError, AttributeError):
-            return None
-
     def scrape_noon(self, query: str) -> List[Product]:
         """Direct Noon search with exact matching."""
-        products = []
-        url = f"https://www.noon.com/egypt-en/search?q={quote_plus(query)}"
-        
         print("\r🔍 Checking Noon.com...")
-        soup = self.get_soup(url)
+        soup = self.get_soup(self._noon_url(query))
+        return self._parse_noon(soup)
+
+    async def scrape_noon_async(self, session, query: str) -> List[Product]:
+        """Async variant of scrape_noon sharing the same parser."""
+        print("\r🔍 Checking Noon.com...")
+        soup = await self._fetch(session, self._noon_url(query))
+        return self._parse_noon(soup)
+
+    def _parse_noon(self, soup: Optional[BeautifulSoup]) -> List[Product]:
+        products = []
+        lines = []
         if not soup:
             return products
 
-        items = soup.select('div[data-qa="product-grid"] div[data-qa="product-item"], div.productContainer')
+        items = _NOON_ITEMS.select(soup, limit=30)
         print(f"Found {len(items)} items on Noon...")
 
-        for item in items[:30]:
+        for item in items:
             try:
-                name_elem = item.select_one('div[data-qa="product-name"], div.name')
-                price_elem = item.select_one('div[data-qa="price-box"] strong, span.price')
-                link = item.select_one('a[href*="/egypt-en/"]')
+                name_elem = _select_first(_NOON_NAMES, item)
+                price_elem = _select_first(_NOON_PRICES, item)
+                link = _NOON_LINK.select_one(item)
                 
                 if not all([name_elem, price_elem, link]):
                     continue
@@ -457,31 +650,41 @@ class WebScraper:
                     url=url,
                     timestamp=datetime.now()
                 ))
-                print(f"Found: {name[:50]}... at {price} EGP")
+                lines.append(f"Found: {name[:50]}... at {price} EGP")
 
             except Exception as e:
                 logging.debug(f"Error parsing Noon item: {e}")
 
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
         return products
 
     def scrape_carrefour(self, query: str) -> List[Product]:
         """Direct Carrefour search with exact matching."""
-        products = []
-        url = f"https://www.carrefouregypt.com/mafegy/en/search?q={quote_plus(query)}"
-        
         print("\r🔍 Checking Carrefour...")
-        soup = self.get_soup(url)
+        soup = self.get_soup(self._carrefour_url(query))
+        return self._parse_carrefour(soup)
+
+    async def scrape_carrefour_async(self, session, query: str) -> List[Product]:
+        """Async variant of scrape_carrefour sharing the same parser."""
+        print("\r🔍 Checking Carrefour...")
+        soup = await self._fetch(session, self._carrefour_url(query))
+        return self._parse_carrefour(soup)
+
+    def _parse_carrefour(self, soup: Optional[BeautifulSoup]) -> List[Product]:
+        products = []
+        lines = []
         if not soup:
             return products
 
-        items = soup.select('div.product-item, div.product_grid_item')
+        items = _CRF_ITEMS.select(soup, limit=30)
         print(f"Found {len(items)} items on Carrefour...")
 
-        for item in items[:30]:
+        for item in items:
             try:
-                name_elem = item.select_one('.product-name, .name')
-                price_elem = item.select_one('.price, .product-price')
-                link = item.select_one('a[href*="/p/"]')
+                name_elem = _select_first(_CRF_NAMES, item)
+                price_elem = _select_first(_CRF_PRICES, item)
+                link = _CRF_LINK.select_one(item)
                 
                 if not all([name_elem, price_elem, link]):
                     continue
@@ -502,11 +705,13 @@ class WebScraper:
                     url=url,
                     timestamp=datetime.now()
                 ))
-                print(f"Found: {name[:50]}... at {price} EGP")
+                lines.append(f"Found: {name[:50]}... at {price} EGP")
 
             except Exception as e:
                 logging.debug(f"Error parsing Carrefour item: {e}")
 
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
         return products
 
 def _shorten_url(url: str) -> str:
@@ -528,31 +733,74 @@ class PriceComparisonTool:
 
     def search_products(self, query: str) -> List[Product]:
         """Search using exact query."""
-        loading_animation()
+        # The HTTP cache lives on the requests session, which only the
+        # threaded path uses — aiohttp fetches would bypass it entirely.
+        # So prefer the threaded path whenever caching is enabled (its
+        # three workers still overlap the store fetches) and keep the
+        # event-loop path for the uncached configuration.
+        use_cache = getattr(self.scraper.session, 'cache', None) is not None
+        if aiohttp is not None and not use_cache:
+            all_products = asyncio.run(self._search_async(query))
+        else:
+            all_products = self._search_threaded(query)
+
+        return sorted(all_products, key=lambda x: x.price)
+
+    async def _search_async(self, query: str) -> List[Product]:
+        """Fetch all stores concurrently on one event loop."""
         all_products = []
-        
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(
+            headers=self.scraper.headers, timeout=timeout
+        ) as session:
+            results = await asyncio.gather(
+                self.scraper.scrape_amazon_async(session, query),
+                self.scraper.scrape_noon_async(session, query),
+                self.scraper.scrape_carrefour_async(session, query),
+                return_exceptions=True
+            )
+        for website, result in zip(
+            ["Amazon Egypt", "Noon Egypt", "Carrefour Egypt"], results
+        ):
+            if isinstance(result, Exception):
+                logging.error(f"Error searching {website}: {result}")
+            elif result:
+                all_products.extend(result)
+        return all_products
+
+    def _search_threaded(self, query: str) -> List[Product]:
+        """Thread-pool fallback used when aiohttp is unavailable."""
+        all_products = []
+
         websites = [
             (self.scraper.scrape_amazon, "Amazon Egypt"),
             (self.scraper.scrape_noon, "Noon Egypt"),
             (self.scraper.scrape_carrefour, "Carrefour Egypt")
         ]
         
-        for scraper_func, website in websites:
-            try:
-                site_products = scraper_func(query)
-                if site_products:
-                    all_products.extend(site_products)
-            except Exception as e:
-                logging.error(f"Error searching {website}: {e}")
-        
-        return sorted(all_products, key=lambda x: x.price)
+        # Each store is an independent host, so run the scrapes in parallel
+        # and wait only for the slowest one instead of the sum of all three.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                executor.submit(scraper_func, query): website
+                for scraper_func, website in websites
+            }
+            for future in concurrent.futures.as_completed(futures):
+                website = futures[future]
+                try:
+                    site_products = future.result()
+                    if site_products:
+                        all_products.extend(site_products)
+                except Exception as e:
+                    logging.error(f"Error searching {website}: {e}")
+
+        return all_products
 
     def _extract_user_price(self, price_input: str) -> Optional[float]:
         if not price_input:
             return None
         try:
-            cleaned = ''.join(c for c in price_input if c.isdigit() or c == '.' or c == ',')
-            cleaned = cleaned.replace(',', '')
+            cleaned = _NONNUM_RE.sub('', price_input).replace(',', '')
             return float(cleaned)
         except ValueError:
             return None
@@ -615,14 +863,16 @@ class PriceComparisonTool:
             print(f"🛒 {best_deal.url}")
 
         print("\n💡 Available on other websites:")
-        websites = set(p.website for p in products)
-        for website in websites:
-            site_products = [p for p in products if p.website == website]
-            if site_products:
-                best_site_deal = min(site_products, key=lambda x: x.price)
-                print(f"\n🏪 {website}:")
-                print(f"💰 Best Price: {best_site_deal.price:,.2f} EGP")
-                print(f"🔗 {_shorten_url(best_site_deal.url)}")
+        # One pass over the products instead of a filter + min per website
+        best_per_site: dict = {}
+        for p in valid_products:
+            current = best_per_site.get(p.website)
+            if current is None or p.price < current.price:
+                best_per_site[p.website] = p
+        for website, best_site_deal in best_per_site.items():
+            print(f"\n🏪 {website}:")
+            print(f"💰 Best Price: {best_site_deal.price:,.2f} EGP")
+            print(f"🔗 {_shorten_url(best_site_deal.url)}")
 
         if len(sorted_products) > 1:
             print("\n📊 All Available Prices:")
@@ -678,8 +928,28 @@ class PriceComparisonTool:
                 logging.error(f"Error opening URL {url}: {e}")
 
     def save_results(self, products: List[Product]) -> None:
-        for product in products:
-            self.db.save_product(product)
+        # Keep only the cheapest row per (name, website) in one pass so
+        # the batch insert writes the winners rather than every scraped
+        # duplicate that INSERT OR REPLACE would overwrite anyway.
+        best: dict = {}
+        for p in products:
+            if not p.name or p.price is None:
+                continue
+            key = (p.name, p.website)
+            current = best.get(key)
+            if current is None or p.price < current.price:
+                best[key] = p
+        self.db.save_products(list(best.values()))
+
+    def clear_http_cache(self) -> None:
+        """Drop cached HTTP responses so the next search re-fetches."""
+        cache = getattr(self.scraper.session, 'cache', None)
+        if cache is None:
+            print("\n❌ HTTP caching is not enabled (requests-cache not installed).")
+        else:
+            cache.clear()
+            print("\n✅ HTTP cache cleared!")
+        input("\nPress Enter to continue...")
 
     def show_price_history(self) -> None:
         while True:
@@ -723,9 +993,10 @@ def main():
         print("=" * 40)
         print("1. Search Products")
         print("2. View History")
-        print("3. Exit")
-        
-        choice = input("\nChoice (1-3): ").strip()
+        print("3. Clear HTTP Cache")
+        print("4. Exit")
+
+        choice = input("\nChoice (1-4): ").strip()
         
         if choice == "1":
             clear_terminal()
@@ -737,11 +1008,19 @@ def main():
                 continue
             
             print("\n")
-            loading_animation()
-            products = tool.search_products(search_query)
-            
+            # Spin the animation only while the scrape is in flight
+            stop = threading.Event()
+            animator = threading.Thread(
+                target=loading_animation, args=(stop,), daemon=True
+            )
+            animator.start()
+            try:
+                products = tool.search_products(search_query)
+            finally:
+                stop.set()
+                animator.join()
+
             print("\n💰 Enter the price you paid (or press Enter to skip): ", end='', flush=True)
-            loading_animation_inline()
             price_input = input().strip()
             
             user_price = tool._extract_user_price(price_input) if price_input else None
@@ -752,8 +1031,11 @@ def main():
         
         elif choice == "2":
             tool.show_price_history()
-            
+
         elif choice == "3":
+            tool.clear_http_cache()
+
+        elif choice == "4":
             print("\n👋 Thanks for using Price Comparison Tool!")
             break
         else: